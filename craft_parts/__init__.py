@@ -18,17 +18,21 @@
 
 __version__ = "2.1.2"
 
+from typing import TYPE_CHECKING, Any
+
 from . import plugins
 from .actions import Action, ActionProperties, ActionType
 from .dirs import ProjectDirs
 from .errors import PartsError
-from .executor import expand_environment
 from .features import Features
 from .infos import PartInfo, ProjectInfo, StepInfo
 from .lifecycle_manager import LifecycleManager
 from .parts import Part, part_has_overlay, validate_part
 from .steps import Step
 
+if TYPE_CHECKING:
+    from .executor import expand_environment
+
 __all__ = [
     "Features",
     "Action",
@@ -47,3 +51,12 @@ __all__ = [
     "validate_part",
     "part_has_overlay",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Lazily resolve names whose modules are expensive to import."""
+    if name == "expand_environment":
+        from .executor import expand_environment  # noqa: PLC0415
+
+        return expand_environment
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
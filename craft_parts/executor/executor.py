@@ -18,6 +18,7 @@
 
 import logging
 import shutil
+from collections.abc import Callable
 from pathlib import Path
 
 from craft_parts import callbacks, overlays, packages, parts, plugins
@@ -291,14 +292,21 @@ class Executor:
 
 
 class ExecutionContext:
-    """A context manager to handle lifecycle action executions."""
+    """A context manager to handle lifecycle action executions.
+
+    :param executor: The executor to run actions with.
+    :param on_exit: An optional callable invoked when the context closes,
+        after executed actions have written their state.
+    """
 
     def __init__(
         self,
         *,
         executor: Executor,
+        on_exit: Callable[[], None] | None = None,
     ) -> None:
         self._executor = executor
+        self._on_exit = on_exit
 
     def __enter__(self) -> "ExecutionContext":
         self._executor.prologue()
@@ -306,6 +314,8 @@ class ExecutionContext:
 
     def __exit__(self, *exc: object) -> None:
         self._executor.epilogue()
+        if self._on_exit is not None:
+            self._on_exit()
 
     def execute(
         self,
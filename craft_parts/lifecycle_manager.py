@@ -16,26 +16,65 @@
 
 """The parts lifecycle manager."""
 
+import functools
 import os
 import re
 import sys
-from collections.abc import Sequence
+import weakref
+from collections.abc import KeysView, Sequence
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from pydantic import ValidationError
 
-from craft_parts import errors, executor, packages, plugins, sequencer
+from craft_parts import errors, packages, plugins, sequencer
 from craft_parts.actions import Action
 from craft_parts.dirs import ProjectDirs
 from craft_parts.features import Features
 from craft_parts.infos import ProjectInfo
 from craft_parts.overlays import LayerHash
-from craft_parts.parts import Part, part_by_name
+from craft_parts.parts import Part
 from craft_parts.state_manager import states
 from craft_parts.steps import Step
 from craft_parts.utils.partition_utils import validate_partition_names
 
+if TYPE_CHECKING:
+    from craft_parts import executor
+
+_APPLICATION_NAME_RE = re.compile(r"^[A-Za-z][0-9A-Za-z_]*\Z")
+
+# Sorted primed stage packages per prime state, keyed on the state's identity
+# (state objects contain sets and can't be used as mapping keys themselves).
+# Entries are evicted when the state object is garbage-collected.
+_primed_sorted_cache: dict[int, list[str]] = {}
+
+
+def _sorted_primed_packages(state: states.PrimeState) -> list[str]:
+    """Return the sorted primed stage packages, sorting each state only once."""
+    key = id(state)
+    cached = _primed_sorted_cache.get(key)
+    if cached is None:
+        cached = sorted(state.primed_stage_packages)
+        _primed_sorted_cache[key] = cached
+        weakref.finalize(state, _primed_sorted_cache.pop, key, None)
+    return cached
+
+
+def _as_path(path: Path | str) -> Path:
+    """Convert to :class:`Path`, skipping the copy if already one."""
+    return path if isinstance(path, Path) else Path(path)
+
+
+@functools.cache
+def _cached_plugin_class(plugin_name: str) -> type[plugins.Plugin]:
+    """Look up a plugin class, memoizing results for repeated plugin names."""
+    return plugins.get_plugin_class(plugin_name)
+
+
+def _clear_plugin_class_cache() -> None:
+    """Invalidate cached plugin class lookups after registry changes."""
+    _cached_plugin_class.cache_clear()
+
 
 class LifecycleManager:
     """Coordinate the planning and execution of the parts lifecycle.
@@ -44,6 +83,9 @@ class LifecycleManager:
     order to obtain a tree of installed files from the specification on how to
     process its parts, and provides a mechanism to execute each of these actions.
 
+    Parts are processed in name order, so the planned actions don't depend on
+    the order in which parts are declared in the specification.
+
     :param all_parts: A dictionary containing the parts specification according
         to the :ref:`parts schema<part_properties>`. The format is compatible with the
         output generated by PyYAML's ``yaml.load``.
@@ -112,7 +154,7 @@ class LifecycleManager:
     ) -> None:
         # pylint: disable=too-many-locals
 
-        if not re.match("^[A-Za-z][0-9A-Za-z_]*$", application_name):
+        if not _APPLICATION_NAME_RE.match(application_name):
             raise errors.InvalidApplicationName(application_name)
 
         if not isinstance(all_parts, dict):
@@ -132,7 +174,7 @@ class LifecycleManager:
 
         project_info = ProjectInfo(
             application_name=application_name,
-            cache_dir=Path(cache_dir),
+            cache_dir=_as_path(cache_dir),
             arch=arch,
             base=base,
             parallel_build_count=parallel_build_count,
@@ -147,17 +189,28 @@ class LifecycleManager:
             **custom_args,
         )
 
+        # deferred so that importing this module doesn't pull in the
+        # executor's heavy transitive dependencies
+        from craft_parts import executor  # noqa: PLC0415
+
         parts_data = all_parts.get("parts", {})
 
         executor.expand_environment(parts_data, info=project_info)
 
-        part_list = []
-        for name, spec in parts_data.items():
-            part = _build_part(name, spec, project_dirs, strict_mode, partitions)
-            _validate_part_dependencies(part, parts_data)
-            part_list.append(part)
+        # sort by part name so that identical projects produce identical
+        # action plans regardless of key order in the parts specification
+        part_list = [
+            _build_part(name, spec, project_dirs, strict_mode, partitions)
+            for name, spec in sorted(parts_data.items())
+        ]
 
-        self._has_overlay = any(p.has_overlay for p in part_list)
+        has_overlay = False
+        known_part_names = parts_data.keys()
+        for part in part_list:
+            _validate_part_dependencies(part, known_part_names)
+            has_overlay = has_overlay or part.has_overlay
+
+        self._has_overlay = has_overlay
 
         # a base layer is mandatory if overlays are in use
         if self._has_overlay:
@@ -176,6 +229,8 @@ class LifecycleManager:
             layer_hash = None
 
         self._part_list = part_list
+        self._part_index = {p.name: p for p in part_list}
+        self._state_cache: dict[tuple[str, Step], states.StepState | None] = {}
         self._application_name = application_name
         self._target_arch = project_info.target_arch
         self._sequencer = sequencer.Sequencer(
@@ -216,6 +271,7 @@ class LifecycleManager:
             all parts will be cleaned and work directories will be removed.
         """
         self._executor.clean(initial_step=step, part_names=part_names)
+        self._state_cache.clear()
 
     def refresh_packages_list(self) -> None:
         """Update the available packages list.
@@ -247,10 +303,19 @@ class LifecycleManager:
     def reload_state(self) -> None:
         """Reload the ephemeral state from disk."""
         self._sequencer.reload_state()
+        self._state_cache.clear()
 
-    def action_executor(self) -> executor.ExecutionContext:
+    def action_executor(self) -> "executor.ExecutionContext":
         """Return a context manager for action execution."""
-        return executor.ExecutionContext(executor=self._executor)
+        from craft_parts import executor  # noqa: PLC0415
+
+        # executed actions write new state files, so drop cached states both
+        # now and when the context closes
+        self._state_cache.clear()
+
+        return executor.ExecutionContext(
+            executor=self._executor, on_exit=self._state_cache.clear
+        )
 
     def get_pull_assets(self, *, part_name: str) -> dict[str, Any] | None:
         """Return the part's pull state assets.
@@ -259,8 +324,10 @@ class LifecycleManager:
 
         :return: The dictionary of the part's pull assets, or None if no state found.
         """
-        part = part_by_name(part_name, self._part_list)
-        state = cast(states.PullState, states.load_step_state(part, Step.PULL))
+        part = self._part_index.get(part_name)
+        if part is None:
+            raise errors.InvalidPartName(part_name)
+        state = cast(states.PullState, self._load_step_state(part, Step.PULL))
         return state.assets if state else None
 
     def get_primed_stage_packages(self, *, part_name: str) -> list[str] | None:
@@ -270,25 +337,41 @@ class LifecycleManager:
 
         :return: The sorted list of primed stage packages, or None if no state found.
         """
-        part = part_by_name(part_name, self._part_list)
-        state = cast(states.PrimeState, states.load_step_state(part, Step.PRIME))
+        part = self._part_index.get(part_name)
+        if part is None:
+            raise errors.InvalidPartName(part_name)
+        state = cast(states.PrimeState, self._load_step_state(part, Step.PRIME))
         if not state:
             return None
 
-        return sorted(state.primed_stage_packages)
+        # return a copy: callers are free to mutate the result
+        return list(_sorted_primed_packages(state))
+
+    def _load_step_state(self, part: Part, step: Step) -> "states.StepState | None":
+        """Load a step state from disk, caching the deserialized result.
+
+        The cache is invalidated whenever state files may change: on
+        :meth:`clean`, :meth:`reload_state` and :meth:`action_executor`.
+        """
+        key = (part.name, step)
+        if key not in self._state_cache:
+            self._state_cache[key] = states.load_step_state(part, step)
+        return self._state_cache[key]
 
 
 def _ensure_overlay_supported() -> None:
     """Overlay is only supported in Linux and requires superuser privileges."""
-    if not Features().enable_overlay:
-        raise errors.FeatureError("Overlays are not supported.")
-
+    # Check platform and privileges first: both are cheap, and failing on
+    # them avoids instantiating the Features singleton at all.
     if sys.platform != "linux":
         raise errors.OverlayPlatformError
 
     if os.geteuid() != 0:
         raise errors.OverlayPermissionError
 
+    if not Features().enable_overlay:
+        raise errors.FeatureError("Overlays are not supported.")
+
 
 def _build_part(
     name: str,
@@ -317,7 +400,7 @@ def _build_part(
         plugin_name = name
 
     try:
-        plugin_class = plugins.get_plugin_class(plugin_name)
+        plugin_class = _cached_plugin_class(plugin_name)
     except ValueError as err:
         if part_name_as_plugin_name:
             # If plugin was not specified, avoid raising an exception telling
@@ -350,7 +433,7 @@ def _build_part(
     )
 
 
-def _validate_part_dependencies(part: Part, parts_data: dict[str, Any]) -> None:
+def _validate_part_dependencies(part: Part, known_names: KeysView[str]) -> None:
     for name in part.dependencies:
-        if name not in parts_data:
+        if name not in known_names:
             raise errors.InvalidPartName(name)
@@ -17,6 +17,7 @@
 """Definitions and helpers to handle plugins."""
 
 import copy
+import sys
 from typing import TYPE_CHECKING, Any
 
 from .ant_plugin import AntPlugin
@@ -116,18 +117,30 @@ def register(plugins: dict[str, PluginType]) -> None:
         are plugin classes. Valid plugins must subclass class:`Plugin`.
     """
     _PLUGINS.update(plugins)
+    _notify_registry_change()
 
 
 def unregister(*plugins: str) -> None:
     """Unregister plugins by name."""
     for plugin in plugins:
         _PLUGINS.pop(plugin, None)
+    _notify_registry_change()
 
 
 def unregister_all() -> None:
     """Unregister all user-registered plugins."""
     global _PLUGINS  # noqa: PLW0603
     _PLUGINS = copy.deepcopy(_BUILTIN_PLUGINS)
+    _notify_registry_change()
+
+
+def _notify_registry_change() -> None:
+    """Invalidate plugin class lookup caches kept by other modules."""
+    # Avoid importing the lifecycle manager (and its dependencies) just to
+    # clear a cache that can't have entries if the module isn't loaded.
+    lifecycle_manager = sys.modules.get("craft_parts.lifecycle_manager")
+    if lifecycle_manager is not None:
+        lifecycle_manager._clear_plugin_class_cache()  # noqa: SLF001
 
 
 def extract_part_properties(
@@ -19,7 +19,7 @@
 import logging
 import os
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from craft_parts.utils import deb_utils
 
@@ -45,6 +45,11 @@ class DebSource(FileSourceHandler):
 
     source_model = DebSourceModel
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Computed once here so each provision call reuses the parsed name.
+        self._source_basename = os.path.basename(self.source)
+
     def provision(
         self,
         dst: Path,
@@ -52,7 +57,7 @@ class DebSource(FileSourceHandler):
         src: Path | None = None,
     ) -> None:
         """Extract deb file contents to the part source dir."""
-        deb_file = src if src else self.part_src_dir / os.path.basename(self.source)
+        deb_file = src if src else self.part_src_dir / self._source_basename
 
         deb_utils.extract_deb(deb_file, dst, logger.debug)
 
@@ -25,6 +25,7 @@ from unittest import mock
 
 import pytest
 import xdg  # type: ignore[import]
+from craft_parts import lifecycle_manager
 from craft_parts.features import Features
 
 from . import fake_servers
@@ -129,6 +130,18 @@ def enable_all_features():
     Features.reset()
 
 
+@pytest.fixture(autouse=True)
+def clear_plugin_class_cache():
+    """Reset memoized plugin class lookups between tests.
+
+    Tests often stub the plugin registry by replacing ``_PLUGINS`` directly,
+    which bypasses the registry-change invalidation hook.
+    """
+    lifecycle_manager._clear_plugin_class_cache()
+    yield
+    lifecycle_manager._clear_plugin_class_cache()
+
+
 @pytest.fixture(autouse=True)
 def temp_xdg(tmpdir, mocker):
     """Use a temporary locaction for XDG directories."""
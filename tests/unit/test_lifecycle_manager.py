@@ -98,6 +98,27 @@ class TestLifecycleManager:
             )
         assert raised.value.part_name == "trololo"
 
+    def test_part_order_deterministic(self, new_dir):
+        """Parts are processed in name order regardless of declaration order."""
+        data = {"parts": {"foo": {"plugin": "nil"}, "bar": {"plugin": "nil"}}}
+        reordered = {"parts": {"bar": {"plugin": "nil"}, "foo": {"plugin": "nil"}}}
+
+        lf1 = lifecycle_manager.LifecycleManager(
+            data,
+            application_name="test_manager",
+            cache_dir=new_dir,
+            **self._lcm_kwargs,
+        )
+        lf2 = lifecycle_manager.LifecycleManager(
+            reordered,
+            application_name="test_manager",
+            cache_dir=new_dir,
+            **self._lcm_kwargs,
+        )
+
+        assert [p.name for p in lf1._part_list] == ["bar", "foo"]
+        assert [p.name for p in lf2._part_list] == ["bar", "foo"]
+
     @pytest.mark.parametrize("work_dir", [".", "work_dir"])
     def test_project_info(self, new_dir, work_dir):
         lf = lifecycle_manager.LifecycleManager(
@@ -289,6 +310,62 @@ class TestLifecycleManager:
         assert "p1" in str(exc.value)
 
 
+class TestStateCaching:
+    """Loaded step states are cached and invalidated when states may change."""
+
+    @pytest.fixture
+    def lifecycle(self, new_dir):
+        return lifecycle_manager.LifecycleManager(
+            {"parts": {"foo": {"plugin": "nil"}}},
+            application_name="test_manager",
+            cache_dir=new_dir,
+        )
+
+    @staticmethod
+    def _write_prime_state(new_dir, packages):
+        state = states.PrimeState(primed_stage_packages=packages)
+        state.write(Path(new_dir, "parts/foo/state/prime"))
+
+    def test_state_cached_between_calls(self, new_dir, lifecycle):
+        self._write_prime_state(new_dir, {"pkg1==1"})
+        assert lifecycle.get_primed_stage_packages(part_name="foo") == ["pkg1==1"]
+
+        # the cached state is served even after the file changes on disk
+        self._write_prime_state(new_dir, {"pkg2==2"})
+        assert lifecycle.get_primed_stage_packages(part_name="foo") == ["pkg1==1"]
+
+    def test_reload_state_invalidates_cache(self, new_dir, lifecycle):
+        self._write_prime_state(new_dir, {"pkg1==1"})
+        assert lifecycle.get_primed_stage_packages(part_name="foo") == ["pkg1==1"]
+
+        self._write_prime_state(new_dir, {"pkg2==2"})
+        lifecycle.reload_state()
+        assert lifecycle.get_primed_stage_packages(part_name="foo") == ["pkg2==2"]
+
+    def test_clean_invalidates_cache(self, new_dir, lifecycle):
+        self._write_prime_state(new_dir, {"pkg1==1"})
+        assert lifecycle.get_primed_stage_packages(part_name="foo") == ["pkg1==1"]
+
+        lifecycle.clean()
+        assert lifecycle.get_primed_stage_packages(part_name="foo") is None
+
+    def test_action_executor_exit_invalidates_cache(self, new_dir, mocker, lifecycle):
+        mocker.patch("craft_parts.executor.Executor.prologue")
+        mocker.patch("craft_parts.executor.Executor.epilogue")
+
+        self._write_prime_state(new_dir, {"pkg1==1"})
+        assert lifecycle.get_primed_stage_packages(part_name="foo") == ["pkg1==1"]
+
+        with lifecycle.action_executor():
+            # entering invalidated the earlier cached state
+            assert lifecycle.get_primed_stage_packages(part_name="foo") == ["pkg1==1"]
+            # simulate an executed action writing new state
+            self._write_prime_state(new_dir, {"pkg2==2"})
+
+        # leaving the context invalidated the state cached inside it
+        assert lifecycle.get_primed_stage_packages(part_name="foo") == ["pkg2==2"]
+
+
 class TestOverlayDisabled:
     """Overlays only supported in linux and must run as root."""
 
@@ -416,3 +493,24 @@ class TestPluginProperties:
                 },
             )
         assert raised.value.part_name == "bar"
+
+
+class TestPluginClassCache:
+    """Plugin class lookups are memoized and must track registry changes."""
+
+    def test_register_invalidates_cache(self):
+        assert lifecycle_manager._cached_plugin_class("nil") is nil_plugin.NilPlugin
+
+        craft_parts.plugins.register({"nil": StrictTestPlugin})
+        assert lifecycle_manager._cached_plugin_class("nil") is StrictTestPlugin
+
+        craft_parts.plugins.unregister_all()
+        assert lifecycle_manager._cached_plugin_class("nil") is nil_plugin.NilPlugin
+
+    def test_unregister_invalidates_cache(self):
+        craft_parts.plugins.register({"strict": StrictTestPlugin})
+        assert lifecycle_manager._cached_plugin_class("strict") is StrictTestPlugin
+
+        craft_parts.plugins.unregister("strict")
+        with pytest.raises(ValueError, match="plugin not registered"):
+            lifecycle_manager._cached_plugin_class("strict")